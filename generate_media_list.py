@@ -1,23 +1,62 @@
 #!/usr/bin/env python3
 import os
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
-def generate_media_list(directories, output_file):
+MEDIA_EXTENSIONS = ('.mp4', '.mkv', '.avi')
+
+def find_media_files(directory, extensions=MEDIA_EXTENSIONS):
+    """
+    Finds media files in a single directory tree, skipping hidden directories.
+
+    Args:
+    directory (str): Directory to search for media files.
+    extensions (tuple of str): Lowercase file extensions, including the dot, to include.
+
+    Returns:
+    list of str: Paths of the media files found, in walk order.
+    """
+    media_files = []
+
+    # Same order and error handling as a top-down os.walk
+    def scan(path):
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False  # e.g. a symlink loop; treat it as a file like os.walk does
+                    if is_dir:
+                        # Ignore hidden directories and, like os.walk, don't follow symlinked ones
+                        if not entry.name.startswith('.') and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.lower().endswith(extensions):
+                        media_files.append(entry.path)
+        except OSError:
+            return  # os.walk silently skipped directories it could not read or list
+        for subdir in subdirs:
+            scan(subdir)
+
+    scan(directory)
+    return media_files
+
+def generate_media_list(directories, output_file, extensions=MEDIA_EXTENSIONS):
     """
     Generates a list of media files from the specified directories and writes them to the output file.
 
     Args:
     directories (list of str): Directories to search for media files.
     output_file (str): Path to the output file where the list will be saved.
+    extensions (tuple of str): Lowercase file extensions, including the dot, to include.
     """
-    media_files = []
-    for directory in directories:
-        for root, dirs, files in os.walk(directory, topdown=True):
-            dirs[:] = [d for d in dirs if not d.startswith('.')]  # Ignore hidden directories
-            for file in files:
-                if file.endswith(('.mp4', '.mkv', '.avi')):
-                    media_files.append(os.path.join(root, file))
-    
+    # Directories often live on separate disks or shares, so walk them concurrently.
+    # executor.map keeps the results in the order the directories were given.
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(directories)))) as executor:
+        results = executor.map(lambda directory: find_media_files(directory, extensions), directories)
+        media_files = [file for files in results for file in files]
+
     with open(output_file, 'w') as f:
         for file in media_files:
             f.write(f"{file}\n")
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 import os
 import argparse
-import glob
+import heapq
 
 def load_expected_titles(expected_titles_file):
     """
@@ -16,18 +16,24 @@ def load_expected_titles(expected_titles_file):
     with open(expected_titles_file, 'r') as f:
         return set(f.read().splitlines())
 
-def find_two_most_recent_media_lists(directory, pattern):
+def find_two_most_recent_media_lists(directory, prefix, suffix):
     """
-    Finds the two most recent media list files in the specified directory matching the given pattern.
+    Finds the two most recent media list files in the specified directory with the given name prefix and suffix.
 
     Args:
     directory (str): The directory to search in.
-    pattern (str): The pattern to match filenames.
+    prefix (str): The prefix filenames must start with.
+    suffix (str): The suffix filenames must end with.
 
     Returns:
     tuple of str: The paths to the most recent and the second most recent media list files.
     """
-    files = sorted(glob.glob(os.path.join(directory, pattern)), key=os.path.getmtime, reverse=True)
+    # One scandir pass reuses each entry's stat data instead of globbing and calling getmtime per file
+    with os.scandir(directory) as entries:
+        files = [(entry.stat().st_mtime, entry.path) for entry in entries
+                 if entry.name.startswith(prefix) and entry.name.endswith(suffix) and entry.is_file()]
+    # Only the top two are needed, so avoid sorting the whole directory
+    files = [path for _, path in heapq.nlargest(2, files)]
     if len(files) < 2:
         return None, None
     return files[0], files[1]  # Return the most recent and the second most recent
@@ -46,9 +52,6 @@ def find_two_most_recent_media_lists(directory, pattern):
             for file in files:
                 if file.endswith(('.mp4', '.mkv', '.avi')):
                     media_files.add(os.path.splitext(file)[0])  # Remove file extension
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 
 def generate_missing_media_list(media_list_dir, output_file):
     """
@@ -58,24 +61,25 @@ def generate_missing_media_list(media_list_dir, output_file):
     media_list_dir (str): Directory containing the media list files.
     output_file (str): Path to the output file where the list of missing media titles will be saved.
     """
-    most_recent_file, second_most_recent_file = find_two_most_recent_media_lists(media_list_dir, 'media_list_*.txt')
+    most_recent_file, second_most_recent_file = find_two_most_recent_media_lists(media_list_dir, 'media_list_', '.txt')
 
-    # Load titles from both files
+    # Load titles from the most recent file, used as the lookup side of the comparison
     def load_titles_from_file(file_path):
         with open(file_path, 'r') as f:
-            return set(f.read().splitlines())
+            return {line.rstrip('\n') for line in f}
 
     most_recent_titles = load_titles_from_file(most_recent_file)
-    second_most_recent_titles = load_titles_from_file(second_most_recent_file)
 
-    # Find missing titles
-    missing_titles = second_most_recent_titles - most_recent_titles
+    # Find missing titles, streaming the older list instead of loading it into a set
+    with open(second_most_recent_file, 'r') as f:
+        titles = (line.rstrip('\n') for line in f)
+        missing_titles = {title for title in titles if title not in most_recent_titles}
 
     if missing_titles:
+        missing_list = '\n'.join(sorted(missing_titles))
         with open(output_file, 'w') as f:
-            for title in sorted(missing_titles):
-                f.write(f"{title}\n")
-        send_email("Missing Media Files", "The following media files are missing:\n\n" + '\n'.join(sorted(missing_titles)))
+            f.write(missing_list + '\n')
+        send_email("Missing Media Files", "The following media files are missing:\n\n" + missing_list)
         print(f"Missing titles written to {output_file}")
     else:
         print("No titles are missing.")
@@ -89,6 +93,11 @@ def main():
     generate_missing_media_list(args.media_list_dir, args.output)
 
 def send_email(subject, body):
+    # Only needed when something is missing, so keep them off the startup path
+    import smtplib
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+
     sender_email = "SENDER_EMAIL_HERE"
     receiver_email = "RECEIVER_EMAIL_HERE"
     password = "PASSWORD_HERE"
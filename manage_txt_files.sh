@@ -4,6 +4,7 @@
 #cd lists
 # Navigate to the directory where the text files are stored. Uncomment and set the correct path.
 
-ls -tp | grep -v '/$' | tail -n +101 | xargs -I {} rm -- {}
+ls -tp | grep -v '/$' | tail -n +101 | tr '\n' '\0' | xargs -0 -r rm --
 # List all files in the current directory without directories, sort them by modification time in descending order,
 # then remove all but the latest 100 files. Adjust the number as needed for different retention requirements.
+# Files are passed to rm in batches rather than spawning one rm per file.